@@ -28,36 +28,31 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# CLI option destinations and the BotConfig fields they override when set.
+_OVERRIDES = (
+    ("poll_interval", "poll_interval"),
+    ("min_edge_bps", "min_edge_bps"),
+    ("max_orders", "max_orders_per_cycle"),
+    ("request_timeout", "request_timeout"),
+    ("max_retries", "max_retries"),
+    ("bankroll", "bankroll"),
+    ("risk_per_trade_pct", "risk_per_trade_pct"),
+    ("max_trades_per_day", "max_trades_per_day"),
+    ("daily_loss_limit_pct", "daily_loss_limit_pct"),
+    ("max_consecutive_losses", "max_consecutive_losses"),
+    ("cooldown_hours", "cooldown_hours"),
+    ("hourly_scan", "hourly_scan"),
+    ("market_cooldown_hours", "market_cooldown_hours"),
+)
+
+
 def build_config(args: argparse.Namespace) -> BotConfig:
-    config = BotConfig()
-    if args.poll_interval:
-        config.poll_interval = args.poll_interval
-    if args.min_edge_bps:
-        config.min_edge_bps = args.min_edge_bps
-    if args.max_orders:
-        config.max_orders_per_cycle = args.max_orders
-    if args.request_timeout:
-        config.request_timeout = args.request_timeout
-    if args.max_retries:
-        config.max_retries = args.max_retries
-    if args.bankroll:
-        config.bankroll = args.bankroll
-    if args.risk_per_trade_pct:
-        config.risk_per_trade_pct = args.risk_per_trade_pct
-    if args.max_trades_per_day:
-        config.max_trades_per_day = args.max_trades_per_day
-    if args.daily_loss_limit_pct:
-        config.daily_loss_limit_pct = args.daily_loss_limit_pct
-    if args.max_consecutive_losses:
-        config.max_consecutive_losses = args.max_consecutive_losses
-    if args.cooldown_hours:
-        config.cooldown_hours = args.cooldown_hours
-    if args.hourly_scan:
-        config.hourly_scan = True
-    if args.market_cooldown_hours:
-        config.market_cooldown_hours = args.market_cooldown_hours
-    config.dry_run = args.dry_run
-    return config
+    overrides = {}
+    for arg_name, field_name in _OVERRIDES:
+        value = getattr(args, arg_name)
+        if value:
+            overrides[field_name] = value
+    return BotConfig(dry_run=args.dry_run, **overrides)
 
 
 def main() -> int:
@@ -1,22 +1,96 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import http.client
 import json
-import urllib.error
-import urllib.request
-from dataclasses import dataclass
+import math
+import random
+import select
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import urlsplit
 
 from .config import BotConfig
 
+MAX_BACKOFF_SECONDS = 8.0
+
+
+class PollymarketHTTPError(RuntimeError):
+    """Non-success HTTP status returned by the Pollymarket API."""
+
+    def __init__(self, status: int, reason: str, retry_after: float | None = None) -> None:
+        super().__init__(f"HTTP error {status} from Pollymarket: {reason}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None  # HTTP-date form; fall back to jittered backoff
+    if not math.isfinite(seconds):
+        return None  # "nan"/"inf" would make the budget check pass and sleep forever
+    return max(seconds, 0.0)
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket has nothing to read; readable means the server closed it.
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
 
 @dataclass(slots=True)
 class PollymarketClient:
+    """Async facade over a small pool of keep-alive HTTP connections.
+
+    Requests run in worker threads, but each one borrows an already open
+    connection when available so repeated polls skip the TCP/TLS handshake.
+    GET responses carrying an ETag are remembered per path and revalidated
+    with If-None-Match, so an unchanged market list costs a 304 round trip.
+    """
+
     config: BotConfig
+    _scheme: str = field(init=False, repr=False)
+    _netloc: str = field(init=False, repr=False)
+    _markets_path: str = field(init=False, repr=False)
+    _orders_path: str = field(init=False, repr=False)
+    _headers: dict[str, str] = field(init=False, repr=False)
+    _json_headers: dict[str, str] = field(init=False, repr=False)
+    _idle: list[http.client.HTTPConnection] = field(init=False, repr=False, default_factory=list)
+    _etags: dict[str, tuple[str, Any]] = field(init=False, repr=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+    _busy: set[http.client.HTTPConnection] = field(init=False, repr=False, default_factory=set)
+    _closed: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self) -> None:
+        parts = urlsplit(self.config.api_base_url)
+        self._scheme = parts.scheme or "https"
+        self._netloc = parts.netloc
+        base_path = parts.path.rstrip("/")
+        self._markets_path = f"{base_path}/markets?active=true"
+        self._orders_path = f"{base_path}/orders"
+        self._headers = self.config.headers()
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
 
     async def _request_with_retries(
         self, method: str, path: str, body: dict[str, Any] | None = None
     ) -> Any:
+        # Each attempt is always awaited to completion; the budget only bounds the waits between
+        # attempts, so a large Retry-After cannot pin the caller and nothing starts past the deadline.
+        budget = self.config.max_retries * (self.config.request_timeout + MAX_BACKOFF_SECONDS)
+        deadline = time.monotonic() + budget
         attempt = 0
         while True:
             try:
@@ -25,30 +99,131 @@ class PollymarketClient:
                 attempt += 1
                 if attempt >= self.config.max_retries:
                     raise
-                await asyncio.sleep(min(2**attempt, 8))
+                delay = getattr(exc, "retry_after", None)
+                if delay is None:
+                    # Full jitter keeps concurrent clients from retrying in lockstep.
+                    delay = random.uniform(0, min(2**attempt, MAX_BACKOFF_SECONDS))
+                if time.monotonic() + delay >= deadline:
+                    raise RuntimeError(
+                        f"Retry budget of {budget:.0f}s for Pollymarket exhausted after {attempt} attempts: {exc}"
+                    ) from exc
+                await asyncio.sleep(delay)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._netloc, timeout=self.config.request_timeout)
+        return http.client.HTTPConnection(self._netloc, timeout=self.config.request_timeout)
 
     def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> Any:
-        url = f"{self.config.api_base_url.rstrip('/')}/{path.lstrip('/')}"
         data = None
+        headers = self._headers
+        cached = self._etags.get(path) if body is None else None
         if body is not None:
-            data = json.dumps(body).encode()
-        request = urllib.request.Request(url=url, data=data, method=method.upper())
-        for key, value in self.config.headers().items():
-            request.add_header(key, value)
-        if data:
-            request.add_header("Content-Type", "application/json")
+            data = json.dumps(body, separators=(",", ":")).encode()
+            headers = self._json_headers
+        elif cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Pollymarket client is closed")
+            conn = None
+            while self._idle:
+                conn = self._idle.pop()
+                if not _is_dropped(conn):
+                    break
+                conn.close()
+                conn = None
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect()  # no I/O until connect()
+            self._busy.add(conn)
         try:
-            with urllib.request.urlopen(request, timeout=self.config.request_timeout) as response:  # noqa: S310 - controlled URL
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as exc:  # noqa: PERF203 - small branching
-            raise RuntimeError(f"HTTP error {exc.code} from Pollymarket: {exc.reason}") from exc
-        except urllib.error.URLError as exc:
-            raise RuntimeError(f"Failed to reach Pollymarket: {exc.reason}") from exc
+            while True:
+                unsent = False
+                try:
+                    if conn.sock is None:
+                        conn.connect()
+                        # close() skips a socket that is not open yet, so re-check once it is.
+                        with self._lock:
+                            closed = self._closed
+                        if closed:
+                            conn.close()
+                            raise RuntimeError("Pollymarket client is closed")
+                    try:
+                        conn.request(method, path, body=data, headers=headers)
+                    except (BrokenPipeError, ConnectionResetError):
+                        unsent = True  # the request never made it onto the wire intact
+                        raise
+                    try:
+                        response = conn.getresponse()
+                    except http.client.RemoteDisconnected:
+                        # Closed before any status line. Safe to resend a GET, but a POST may
+                        # already have been handled.
+                        unsent = method == "GET"
+                        raise
+                    payload = response.read()
+                    break
+                except (OSError, http.client.HTTPException) as exc:
+                    conn.close()
+                    if unsent and reused:
+                        # A pooled keep-alive socket was already closed by the server; resend once
+                        # on a fresh one. Timeouts are never resent here.
+                        with self._lock:
+                            self._busy.discard(conn)
+                            if self._closed:
+                                raise RuntimeError("Pollymarket client is closed") from exc
+                            conn = self._connect()
+                            self._busy.add(conn)
+                        reused = False
+                        continue
+                    raise RuntimeError(f"Failed to reach Pollymarket: {exc}") from exc
+        finally:
+            with self._lock:
+                self._busy.discard(conn)
+        with self._lock:
+            keep = not (response.will_close or self._closed)
+            if keep:
+                self._idle.append(conn)
+        if not keep:
+            conn.close()
+        if response.status == 304 and cached is not None:
+            return cached[1]
+        if response.status >= 400:
+            raise PollymarketHTTPError(
+                response.status, response.reason, _parse_retry_after(response.getheader("Retry-After"))
+            )
+        result = json.loads(payload)
+        etag = response.getheader("ETag")
+        if body is None and etag:
+            self._etags[path] = (etag, result)
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            busy = list(self._busy)
+        for conn in idle:
+            conn.close()
+        for conn in busy:
+            # Unblock worker threads still waiting on the network, otherwise interpreter
+            # shutdown joins them for up to request_timeout. A socket still in its TCP
+            # connect is not open yet; _request notices the close once the connect returns.
+            sock = conn.sock
+            if sock is not None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+
+    async def __aenter__(self) -> PollymarketClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
 
     async def fetch_markets(self) -> list[dict[str, Any]]:
-        return await self._request_with_retries("GET", "/markets?active=true")
+        return await self._request_with_retries("GET", self._markets_path)
 
     async def submit_order(self, order: dict[str, Any]) -> Any:
         if not self.config.api_key:
             raise RuntimeError("Cannot submit orders without POLLYMARKET_API_KEY")
-        return await self._request_with_retries("POST", "/orders", order)
+        return await self._request_with_retries("POST", self._orders_path, order)
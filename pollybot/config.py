@@ -1,34 +1,57 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
 
 
-@dataclass(slots=True)
+def _env(names: str | tuple[str, ...], default: str | None, cast: Callable[[str], Any] = str) -> Any:
+    """Declare a field whose default is read from the environment per instance.
+
+    When several variable names are given, the first one that is set wins.
+    """
+
+    if isinstance(names, str):
+        names = (names,)
+
+    def factory() -> Any:
+        value = next((os.environ[name] for name in names if name in os.environ), default)
+        return value if value is None else cast(value)
+
+    return field(default_factory=factory)
+
+
+def _flag(value: str) -> bool:
+    return value.lower() == "true"
+
+
+@dataclass(slots=True, frozen=True)
 class BotConfig:
     """Configuration for the Pollymarket bot.
 
     Values are primarily loaded from environment variables, but defaults are
     provided so the bot can start without additional configuration for data
-    scraping. Trading calls require an API key.
+    scraping. Trading calls require an API key. Instances are immutable; CLI
+    overrides are passed to the constructor.
     """
 
-    api_base_url: str = os.environ.get("POLLYMARKET_API_BASE", "https://clob.polymarket.com")
-    api_key: str | None = os.environ.get("POLLYMARKET_API_KEY")
-    poll_interval: float = float(os.environ.get("POLLYMARKET_POLL_INTERVAL", "30"))
-    min_edge_bps: float = float(os.environ.get("POLLYMARKET_MIN_EDGE_BPS", "50"))
-    max_orders_per_cycle: int = int(os.environ.get("POLLYMARKET_MAX_ORDERS_PER_CYCLE", "1"))
-    request_timeout: float = float(os.environ.get("POLLYMARKET_REQUEST_TIMEOUT", "30"))
-    max_retries: int = int(os.environ.get("POLLYMARKET_MAX_RETRIES", "3"))
-
-    bankroll: float = float(os.environ.get("POLLYBOT_BANKROLL", os.environ.get("BANKROLL", "1000")))
-    risk_per_trade_pct: float = float(os.environ.get("RISK_PER_TRADE_PCT", "0.005"))
-    max_trades_per_day: int = int(os.environ.get("MAX_TRADES_PER_DAY", "10"))
-    daily_loss_limit_pct: float = float(os.environ.get("DAILY_LOSS_LIMIT_PCT", "0.02"))
-    max_consecutive_losses: int = int(os.environ.get("MAX_CONSECUTIVE_LOSSES", "3"))
-    cooldown_hours: int = int(os.environ.get("COOLDOWN_HOURS", "24"))
-    hourly_scan: bool = os.environ.get("HOURLY_SCAN", "false").lower() == "true"
-    market_cooldown_hours: int = int(os.environ.get("MARKET_COOLDOWN_HOURS", "3"))
+    api_base_url: str = _env("POLLYMARKET_API_BASE", "https://clob.polymarket.com")
+    api_key: str | None = _env("POLLYMARKET_API_KEY", None)
+    poll_interval: float = _env("POLLYMARKET_POLL_INTERVAL", "30", float)
+    min_edge_bps: float = _env("POLLYMARKET_MIN_EDGE_BPS", "50", float)
+    max_orders_per_cycle: int = _env("POLLYMARKET_MAX_ORDERS_PER_CYCLE", "1", int)
+    request_timeout: float = _env("POLLYMARKET_REQUEST_TIMEOUT", "30", float)
+    max_retries: int = _env("POLLYMARKET_MAX_RETRIES", "3", int)
+
+    bankroll: float = _env(("POLLYBOT_BANKROLL", "BANKROLL"), "1000", float)
+    risk_per_trade_pct: float = _env("RISK_PER_TRADE_PCT", "0.005", float)
+    max_trades_per_day: int = _env("MAX_TRADES_PER_DAY", "10", int)
+    daily_loss_limit_pct: float = _env("DAILY_LOSS_LIMIT_PCT", "0.02", float)
+    max_consecutive_losses: int = _env("MAX_CONSECUTIVE_LOSSES", "3", int)
+    cooldown_hours: int = _env("COOLDOWN_HOURS", "24", int)
+    hourly_scan: bool = _env("HOURLY_SCAN", "false", _flag)
+    market_cooldown_hours: int = _env("MARKET_COOLDOWN_HOURS", "3", int)
     dry_run: bool = False
 
     def headers(self) -> dict[str, str]:
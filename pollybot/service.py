@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import math
+import time
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from signal import SIGTERM
 
 from .client import PollymarketClient
 from .config import BotConfig
@@ -11,21 +16,26 @@ from .strategy import MarketSignal, find_edges
 
 logger = logging.getLogger(__name__)
 
+MAX_TRADES_REASON = "Max trades per day reached"
+HOURLY_SCAN_INTERVAL = 3600.0
+
 
 @dataclass(slots=True)
 class RiskState:
     trades_today: int = 0
     daily_pnl: float = 0.0
     consecutive_losses: int = 0
-    last_pause: datetime | None = None
+    last_pause: float | None = None  # time.monotonic() when the loss cooldown started
     current_day: datetime | None = None
-    market_last_trade: dict[str, datetime] = field(default_factory=dict)
+    market_last_trade: dict[str, float] = field(default_factory=dict)  # time.monotonic() of last trade
 
 
 class RiskManager:
     def __init__(self, config: BotConfig) -> None:
         self.config = config
         self.state = RiskState(current_day=datetime.now(UTC))
+        self._cooldown_s = config.cooldown_hours * 3600.0
+        self._market_cooldown_s = config.market_cooldown_hours * 3600.0
 
     def _reset_daily(self, now: datetime) -> None:
         if self.state.current_day is None or now.date() != self.state.current_day.date():
@@ -35,38 +45,45 @@ class RiskManager:
     def effective_bankroll(self) -> float:
         return max(self.config.bankroll + self.state.daily_pnl, 0.0)
 
-    def _cooldown_active(self, now: datetime) -> bool:
+    def _cooldown_active(self, mono: float) -> bool:
         if self.state.last_pause is None:
             return False
-        cooldown_until = self.state.last_pause + timedelta(hours=self.config.cooldown_hours)
-        if now < cooldown_until:
+        if mono < self.state.last_pause + self._cooldown_s:
             return True
         self.state.last_pause = None
         self.state.consecutive_losses = 0
         logger.info("Cooldown expired; counters reset")
         return False
 
-    def check_can_trade(self, now: datetime) -> tuple[bool, str]:
+    def check_can_trade(self, now: datetime, mono: float) -> tuple[bool, str]:
+        """Evaluate the account-level limits once per cycle.
+
+        Within a cycle only ``trades_today`` can change (trades are booked with
+        zero PnL), so per-signal callers only need ``has_trade_capacity``.
+        """
+
         self._reset_daily(now)
+        if not self.has_trade_capacity():
+            return False, MAX_TRADES_REASON
+        if self._cooldown_active(mono):
+            return False, "Cooling down after losses"
+        if self.state.consecutive_losses >= self.config.max_consecutive_losses:
+            if self.state.last_pause is None:
+                self.state.last_pause = mono
+                logger.warning("Entering cooldown after %s consecutive losses", self.state.consecutive_losses)
+            return False, "Max consecutive losses reached"
         bankroll = self.effective_bankroll()
         if bankroll <= 0:
             return False, "No bankroll configured"
-        if self._cooldown_active(now):
-            return False, "Cooling down after losses"
-        if self.state.trades_today >= self.config.max_trades_per_day:
-            return False, "Max trades per day reached"
         loss_limit = -self.config.daily_loss_limit_pct * bankroll
         if self.state.daily_pnl <= loss_limit:
             return False, "Daily loss limit reached"
-        if self.state.consecutive_losses >= self.config.max_consecutive_losses:
-            if self.state.last_pause is None:
-                self.state.last_pause = now
-                logger.warning("Entering cooldown after %s consecutive losses", self.state.consecutive_losses)
-            return False, "Max consecutive losses reached"
         return True, "OK"
 
-    def record_trade(self, pnl_change: float, now: datetime | None = None) -> None:
-        now = now or datetime.now(UTC)
+    def has_trade_capacity(self) -> bool:
+        return self.state.trades_today < self.config.max_trades_per_day
+
+    def record_trade(self, pnl_change: float, mono: float) -> None:
         self.state.trades_today += 1
         self.state.daily_pnl += pnl_change
         if pnl_change < 0:
@@ -74,17 +91,14 @@ class RiskManager:
         else:
             self.state.consecutive_losses = 0
         if self.state.consecutive_losses >= self.config.max_consecutive_losses and self.state.last_pause is None:
-            self.state.last_pause = now
+            self.state.last_pause = mono
             logger.warning("Entering cooldown after %s consecutive losses", self.state.consecutive_losses)
 
-    def market_blocked(self, market_id: str, now: datetime) -> bool:
-        last_trade = self.state.market_last_trade.get(market_id)
-        if last_trade is None:
-            return False
-        return now - last_trade < timedelta(hours=self.config.market_cooldown_hours)
+    def market_blocked(self, market_id: str, mono: float) -> bool:
+        return mono - self.state.market_last_trade.get(market_id, -math.inf) < self._market_cooldown_s
 
-    def record_market_trade(self, market_id: str, now: datetime) -> None:
-        self.state.market_last_trade[market_id] = now
+    def record_market_trade(self, market_id: str, mono: float) -> None:
+        self.state.market_last_trade[market_id] = mono
 
 
 def describe_signal(signal: MarketSignal) -> dict[str, object]:
@@ -100,107 +114,117 @@ async def fetch_markets(client: PollymarketClient) -> list[dict[str, object]]:
     return await client.fetch_markets()
 
 
-def _extract_prices(market: dict[str, object]) -> tuple[float | None, float | None]:
-    outcomes = market.get("outcomes") or []
-    yes_price = next((o.get("price") for o in outcomes if str(o.get("name", "")).lower() == "yes"), None)
-    no_price = next((o.get("price") for o in outcomes if str(o.get("name", "")).lower() == "no"), None)
-    return yes_price, no_price
-
-
-def liquidity_and_spread_ok(market: dict[str, object]) -> tuple[bool, str]:
-    liquidity = market.get("liquidity") or market.get("volume24h") or market.get("tvl")
-    if liquidity is not None:
-        try:
-            if float(liquidity) <= 0:
-                return False, "Liquidity too low"
-        except (TypeError, ValueError):
-            return False, "Liquidity unreadable"
-
-    yes_price, no_price = _extract_prices(market)
-    if yes_price is None or no_price is None:
-        return False, "Missing bid/ask prices"
-    try:
-        spread = abs(float(yes_price) - float(no_price))
-    except (TypeError, ValueError):
-        return False, "Spread unreadable"
-    if spread > 0.2:
-        return False, "Spread too wide"
-    return True, "OK"
-
-
 async def run_bot(config: BotConfig) -> None:
     client = PollymarketClient(config)
     risk = RiskManager(config)
     logger.info("Starting Pollymarket bot with interval %.1fs", config.poll_interval)
-    next_scan: datetime = datetime.now(UTC)
+    next_scan = time.monotonic()
+    stopping = False
+    cancellable = True  # False while orders are being submitted
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+
+    def _on_sigterm() -> None:
+        # Interrupt an idle wait or a fetch at once, but let submitted orders be acknowledged
+        # and logged; the loop then stops after the cycle.
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        logger.info("Received SIGTERM, shutting down")
+        if cancellable:
+            task.cancel()
 
-    async def _execute_signal(signal: MarketSignal, now: datetime) -> None:
-        try:
-            logger.info("Signal %s", signal.reason)
-        except Exception:  # noqa: BLE001 - logging must not break execution
-            pass
-        risk.record_market_trade(signal.market_id, now)
-        risk.record_trade(0.0, now)
+    with contextlib.suppress(NotImplementedError):  # not available on Windows event loops
+        loop.add_signal_handler(SIGTERM, _on_sigterm)
+
+    def _reserve_signal(signal: MarketSignal, mono: float) -> None:
+        # Booked synchronously so later signals in the same cycle see the updated limits.
+        logger.info("Signal %s", signal.reason)
+        risk.record_market_trade(signal.market_id, mono)
+        risk.record_trade(0.0, mono)
+
+    async def _execute_signal(signal: MarketSignal) -> None:
         if config.dry_run:
-            try:
-                logger.info("Dry-run enabled, not sending order: %s", describe_signal(signal))
-            except Exception:  # noqa: BLE001 - logging must not break execution
-                pass
+            logger.info("Dry-run enabled, not sending order: %s", signal)
             return
         try:
             order = await client.submit_order(describe_signal(signal))
             logger.info("Submitted order %s", order)
         except Exception:  # noqa: BLE001 - log all failures for visibility
             logger.exception("Failed to submit order")
-    try:
-        while True:
-            now = datetime.now(UTC)
-            try:
-                if config.hourly_scan and now < next_scan:
-                    await asyncio.sleep(config.poll_interval)
-                    continue
-
-                markets = await fetch_markets(client)
-                logger.info("Fetched %s markets for scan", len(markets))
-                order_size = config.calc_order_size(risk.effective_bankroll())
-                signals = find_edges(
-                    markets,
-                    min_edge_bps=config.min_edge_bps,
-                    max_orders=config.max_orders_per_cycle,
-                    order_size=order_size,
-                )
-                market_by_id = {str(market.get("id")): market for market in markets}
-
-                if not signals:
-                    logger.info("HOURLY SCAN - NO TRADE: %s", "No edges above threshold")
-                else:
-                    for signal in signals:
-                        market = market_by_id.get(signal.market_id, {})
-                        ok_market, market_reason = liquidity_and_spread_ok(market)
-                        if not ok_market:
-                            logger.info("HOURLY SCAN - NO TRADE: %s", market_reason)
-                            continue
-                        can_trade, reason = risk.check_can_trade(now)
-                        if signal.size <= 0:
-                            logger.info("HOURLY SCAN - NO TRADE: order size is zero")
-                            continue
-                        if not can_trade:
-                            logger.info("HOURLY SCAN - NO TRADE: %s", reason)
-                            continue
-                        if risk.market_blocked(signal.market_id, now):
-                            logger.info(
-                                "HOURLY SCAN - NO TRADE: market %s in cooldown",
-                                signal.market_id,
-                            )
-                            continue
-
-                        await _execute_signal(signal, now)
-
-                next_scan = now + timedelta(hours=1) if config.hourly_scan else now + timedelta(seconds=config.poll_interval)
-
-            except Exception:  # noqa: BLE001 - log unexpected failures per cycle
-                logger.exception("Cycle failed; will retry after backoff")
-            await asyncio.sleep(config.poll_interval)
-    except asyncio.CancelledError:
-        logger.info("Bot cancelled, shutting down")
-        raise
+    async with client:
+        try:
+            while not stopping:
+                delay = next_scan - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                mono = time.monotonic()
+                now = datetime.now(UTC)  # calendar date for the daily counters only
+                try:
+                    # The cycle is network-bound: time the fetch and the scan separately.
+                    started = time.perf_counter()
+                    markets = await fetch_markets(client)
+                    fetch_ms = (time.perf_counter() - started) * 1000
+                    logger.info("Fetched %s markets for scan in %.0f ms", len(markets), fetch_ms)
+                    order_size = config.calc_order_size(risk.effective_bankroll())
+                    started = time.perf_counter()
+                    signals = find_edges(
+                        markets,
+                        min_edge_bps=config.min_edge_bps,
+                        max_orders=config.max_orders_per_cycle,
+                        order_size=order_size,
+                    )
+                    logger.debug("Edge scan took %.2f ms", (time.perf_counter() - started) * 1000)
+
+                    if not signals:
+                        logger.info("HOURLY SCAN - NO TRADE: %s", "No edges above threshold")
+                    else:
+                        rejected: Counter[str] = Counter()
+                        approved: list[MarketSignal] = []
+                        cooldown: list[str] = []
+                        can_trade, reason = risk.check_can_trade(now, mono)
+                        for signal in signals:
+                            if signal.size <= 0:
+                                rejected["order size is zero"] += 1
+                                continue
+                            if not can_trade:
+                                rejected[reason] += 1
+                                continue
+                            if not risk.has_trade_capacity():
+                                rejected[MAX_TRADES_REASON] += 1
+                                continue
+                            if risk.market_blocked(signal.market_id, mono):
+                                cooldown.append(signal.market_id)
+                                continue
+
+                            _reserve_signal(signal, mono)
+                            approved.append(signal)
+                        if cooldown:
+                            rejected[f"market in cooldown ({', '.join(cooldown)})"] = len(cooldown)
+                        if rejected:
+                            logger.info("HOURLY SCAN - NO TRADE: %s", dict(rejected))
+                        cancellable = False
+                        try:
+                            await asyncio.gather(*(_execute_signal(signal) for signal in approved))
+                        finally:
+                            cancellable = True
+
+                    # Hourly scans keep a fixed cadence from their start; polling leaves a full
+                    # poll_interval gap after each cycle, so a slow cycle is never followed at once.
+                    if config.hourly_scan:
+                        next_scan = mono + HOURLY_SCAN_INTERVAL
+                    else:
+                        next_scan = time.monotonic() + config.poll_interval
+
+                except Exception:  # noqa: BLE001 - log unexpected failures per cycle
+                    logger.exception("Cycle failed; will retry after backoff")
+                    next_scan = time.monotonic() + config.poll_interval
+        except asyncio.CancelledError:
+            if not stopping:
+                logger.info("Bot cancelled, shutting down")
+                raise
+            task.uncancel()
+        finally:
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(SIGTERM)
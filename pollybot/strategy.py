@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import heapq
+import logging
 from dataclasses import dataclass
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+MAX_SPREAD = 0.2
+# Common spellings are matched directly; anything else is lowercased first.
+_YES_NAMES = frozenset({"Yes", "yes", "YES"})
+_NO_NAMES = frozenset({"No", "no", "NO"})
+
 
 @dataclass(slots=True)
 class MarketSignal:
@@ -13,6 +22,49 @@ class MarketSignal:
     reason: str
 
 
+def yes_no_prices(market: dict[str, Any]) -> tuple[Any, Any]:
+    """Return the first "yes" and "no" outcome prices of a market in one pass."""
+
+    yes_price = no_price = None
+    for outcome in market.get("outcomes") or []:
+        name = outcome.get("name")
+        if type(name) is not str:
+            continue
+        if name not in _YES_NAMES and name not in _NO_NAMES:
+            name = name.lower()
+        if name in _YES_NAMES:
+            if yes_price is None:
+                yes_price = outcome.get("price")
+        elif name in _NO_NAMES:
+            if no_price is None:
+                no_price = outcome.get("price")
+    return yes_price, no_price
+
+
+def liquidity_and_spread_ok(
+    market: dict[str, Any], yes_price: Any, no_price: Any
+) -> tuple[bool, str, float, float]:
+    """Filter a market and return its yes/no prices parsed as floats."""
+
+    if yes_price is None or no_price is None:
+        return False, "Missing bid/ask prices", 0.0, 0.0
+    try:
+        yes_price, no_price = float(yes_price), float(no_price)
+    except (TypeError, ValueError):
+        return False, "Spread unreadable", 0.0, 0.0
+    if abs(yes_price - no_price) > MAX_SPREAD:
+        return False, "Spread too wide", yes_price, no_price
+
+    liquidity = market.get("liquidity") or market.get("volume24h") or market.get("tvl")
+    if liquidity is not None:
+        try:
+            if float(liquidity) <= 0:
+                return False, "Liquidity too low", yes_price, no_price
+        except (TypeError, ValueError):
+            return False, "Liquidity unreadable", yes_price, no_price
+    return True, "OK", yes_price, no_price
+
+
 def find_edges(
     markets: list[dict[str, Any]], *, min_edge_bps: float, max_orders: int, order_size: float
 ) -> list[MarketSignal]:
@@ -20,28 +72,29 @@ def find_edges(
 
     The heuristic looks for markets with both "yes" and "no" prices where the
     spread implies a combined probability below 1.0 by the provided basis points.
+    Markets failing the liquidity/spread filter are skipped before any edge
+    maths. Of the remaining candidates the ``max_orders`` largest edges are
+    returned, best first.
     """
 
-    signals: list[MarketSignal] = []
+    candidates: list[tuple[float, dict[str, Any], float, float]] = []
     for market in markets:
-        if len(signals) >= max_orders:
-            break
-        outcomes = market.get("outcomes") or []
-        if len(outcomes) < 2:
-            continue
-        yes_price = next((o.get("price") for o in outcomes if o.get("name", "").lower() == "yes"), None)
-        no_price = next((o.get("price") for o in outcomes if o.get("name", "").lower() == "no"), None)
-        if yes_price is None or no_price is None:
+        yes_raw, no_raw = yes_no_prices(market)
+        ok_market, market_reason, yes_price, no_price = liquidity_and_spread_ok(market, yes_raw, no_raw)
+        if not ok_market:
+            logger.debug("Skipping market %s: %s", market.get("id"), market_reason)
             continue
         edge = (1 - (yes_price + no_price)) * 10_000  # basis points
         if edge >= min_edge_bps:
-            signals.append(
-                MarketSignal(
-                    market_id=str(market.get("id")),
-                    outcome="yes" if yes_price < no_price else "no",
-                    size=order_size,
-                    price=yes_price if yes_price < no_price else no_price,
-                    reason=f"Edge {edge:.0f} bps on {market.get('question', 'unknown')}",
-                )
-            )
-    return signals
+            candidates.append((edge, market, yes_price, no_price))
+
+    return [
+        MarketSignal(
+            market_id=str(market.get("id")),
+            outcome="yes" if yes_price < no_price else "no",
+            size=order_size,
+            price=yes_price if yes_price < no_price else no_price,
+            reason=f"Edge {edge:.0f} bps on {market.get('question', 'unknown')}",
+        )
+        for edge, market, yes_price, no_price in heapq.nlargest(max_orders, candidates, key=lambda c: c[0])
+    ]